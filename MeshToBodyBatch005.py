@@ -4,140 +4,276 @@ import Mesh
 import Part
 import PartDesign
 from PySide import QtGui, QtCore
+import numpy as np
+import hashlib
+import json
 import time
+from contextlib import contextmanager
+
+# --- Scratch objects ---
+# Reused across meshes so a batch of many small meshes does not allocate a fresh
+# Part.Shape / Mesh.Mesh for each one. Conversion is serial, so sharing them is safe.
+# Both are emptied after each use so they do not keep the last mesh's data alive.
+_shape_scratch = Part.Shape()
+_mesh_scratch = Mesh.Mesh()
+
+
+# --- Silent batch mode ---
+@contextmanager
+def _batch_mode():
+    """
+    Buffer console output and suspend GUI updates for the duration of a batch.
+    Every console print otherwise flushes to the Report View and repaints it.
+    Messages, warnings and errors are buffered together so they keep their order,
+    and are replayed when the batch ends with one call per run of the same level.
+    """
+    console = FreeCAD.Console
+    original_printers = {
+        'PrintMessage': console.PrintMessage,
+        'PrintWarning': console.PrintWarning,
+        'PrintError': console.PrintError,
+    }
+    original_update_gui = FreeCADGui.updateGui
+    buffer = []
+
+    main_window = None
+    try:
+        main_window = FreeCADGui.getMainWindow()
+    except Exception:
+        pass
+
+    try:
+        for level in original_printers:
+            setattr(console, level, lambda text, level=level: buffer.append((level, text)))
+        FreeCADGui.updateGui = lambda: None
+        if main_window is not None:
+            main_window.setUpdatesEnabled(False)
+        yield
+    finally:
+        for level, printer in original_printers.items():
+            setattr(console, level, printer)
+        FreeCADGui.updateGui = original_update_gui
+        if main_window is not None:
+            main_window.setUpdatesEnabled(True)
+
+        # Replay in order, merging consecutive entries of the same level
+        run_level, run_text = None, []
+        for level, text in buffer:
+            if level != run_level and run_text:
+                original_printers[run_level]("".join(run_text))
+                run_text = []
+            run_level = level
+            run_text.append(text)
+        if run_text:
+            original_printers[run_level]("".join(run_text))
+
 
 # --- Fallback comprehensive manual repair ---
-def attempt_comprehensive_manual_repair(mesh_obj):
+def _flush_log(log_lines):
+    """
+    Print the collected log lines with a single console call and clear the list.
+    """
+    if log_lines:
+        FreeCAD.Console.PrintMessage("\n".join(log_lines) + "\n")
+        log_lines.clear()
+
+
+def attempt_comprehensive_manual_repair(mesh_obj, topology=None, initial_has_non_manifolds=None, initial_has_self_intersections=None):
     """
     Comprehensive manual repair using direct Mesh API methods.
     This function now handles the mutable object creation internally.
+    Known evaluation flags can be passed in to skip re-checks and repairs that do not apply.
     """
+    # Messages are collected and printed in one call, instead of one Report View update per line
+    log_lines = []
     try:
         # Get the current mesh data (which might be immutable if directly from doc object property)
-        original_mesh_topology = mesh_obj.Mesh.Topology
-        # Create a new, independent, and mutable Mesh.Mesh object for modifications
-        mutable_mesh = Mesh.Mesh(original_mesh_topology)
-        FreeCAD.Console.PrintMessage(f"🔧 Falling back to manual comprehensive repair for '{mesh_obj.Name}'...\n")
+        original_mesh_topology = topology if topology is not None else mesh_obj.Mesh.Topology
+        # Refill the independent, mutable scratch mesh for modifications
+        # (assigning it back to mesh_obj.Mesh copies the data)
+        mutable_mesh = _mesh_scratch
+        mutable_mesh.clear()
+        mutable_mesh.addFacets(original_mesh_topology)
+        log_lines.append(f"🔧 Falling back to manual comprehensive repair for '{mesh_obj.Name}'...")
 
         repairs_applied = []
         # Flag to track if self-intersections were successfully fixed on the mutable_mesh (internal check)
         self_intersections_fixed_on_mutable = False
+        # Result of the latest diagnostic solid check, reused for the final result
+        last_is_solid = mutable_mesh.isSolid()
 
         # --- DIAGNOSTIC: Initial solid status of mutable_mesh ---
-        FreeCAD.Console.PrintMessage(f"📊 DIAGNOSTIC: Mutable mesh initial Solid: {mutable_mesh.isSolid()}, Points: {mutable_mesh.CountPoints}, Facets: {mutable_mesh.CountFacets}\n")
+        log_lines.append(f"📊 DIAGNOSTIC: Mutable mesh initial Solid: {last_is_solid}, Points: {mutable_mesh.CountPoints}, Facets: {mutable_mesh.CountFacets}")
+
 
+        initial_facet_count = mutable_mesh.CountFacets
 
         # Prioritize fixing self-intersections immediately if detected
-        initial_has_self_intersections = mutable_mesh.hasSelfIntersections()
+        if initial_has_self_intersections is None:
+            initial_has_self_intersections = mutable_mesh.hasSelfIntersections()
+        last_has_self_intersections = initial_has_self_intersections
         
         if initial_has_self_intersections:
-            FreeCAD.Console.PrintMessage("🔧 Fix self-intersections (priority pass)...)\n")
+            log_lines.append("🔧 Fix self-intersections (priority pass)...)")
             try:
                 mutable_mesh.fixSelfIntersections()
                 repairs_applied.append("Fix self-intersections (priority)")
                 
                 # --- DIAGNOSTIC: Solid status after fixSelfIntersections ---
-                FreeCAD.Console.PrintMessage(f"📊 DIAGNOSTIC: Solid after fixSelfIntersections: {mutable_mesh.isSolid()}, Points: {mutable_mesh.CountPoints}, Facets: {mutable_mesh.CountFacets}\n")
+                last_is_solid = mutable_mesh.isSolid()
+                log_lines.append(f"📊 DIAGNOSTIC: Solid after fixSelfIntersections: {last_is_solid}, Points: {mutable_mesh.CountPoints}, Facets: {mutable_mesh.CountFacets}")
 
                 # After fixing self-intersections, harmonize normals as they often get messed up
-                FreeCAD.Console.PrintMessage("🔧 Harmonize Normals (after self-intersection fix)...\n")
+                log_lines.append("🔧 Harmonize Normals (after self-intersection fix)...")
                 mutable_mesh.harmonizeNormals()
                 repairs_applied.append("Harmonize Normals (after self-intersection fix)")
 
                 # --- DIAGNOSTIC: Solid status after harmonizeNormals (post-self-intersection) ---
-                FreeCAD.Console.PrintMessage(f"📊 DIAGNOSTIC: Solid after Harmonize Normals (post-SI fix): {mutable_mesh.isSolid()}, Points: {mutable_mesh.CountPoints}, Facets: {mutable_mesh.CountFacets}\n")
+                last_is_solid = mutable_mesh.isSolid()
+                log_lines.append(f"📊 DIAGNOSTIC: Solid after Harmonize Normals (post-SI fix): {last_is_solid}, Points: {mutable_mesh.CountPoints}, Facets: {mutable_mesh.CountFacets}")
 
                 # Re-check self-intersections on the mutable_mesh itself
-                if not mutable_mesh.hasSelfIntersections():
-                    FreeCAD.Console.PrintMessage("✅ Self-intersections fixed in mutable mesh (internal check).\n")
+                last_has_self_intersections = mutable_mesh.hasSelfIntersections()
+                if not last_has_self_intersections:
+                    log_lines.append("✅ Self-intersections fixed in mutable mesh (internal check).")
                     self_intersections_fixed_on_mutable = True # Mark as fixed
                 else:
-                    FreeCAD.Console.PrintMessage("❌ Self-intersections persist in mutable mesh after priority fix (internal check).\n")
+                    log_lines.append("❌ Self-intersections persist in mutable mesh after priority fix (internal check).")
 
             except Exception as e:
-                FreeCAD.Console.PrintMessage(f"🔧 Fix self-intersections (priority pass) failed: {e}\n")
+                log_lines.append(f"🔧 Fix self-intersections (priority pass) failed: {e}")
 
 
         # Apply other general repair methods on the mutable_mesh
-        # Exclude 'fixSelfIntersections' and 'harmonizeNormals' from this loop if they were handled above
-        repair_methods = [
-            ("removeDuplicatedPoints", "Remove duplicate points"),
-            ("removeDuplicatedFacets", "Remove duplicate facets"),
-            ("removeInvalidPoints", "Remove invalid points"),
-            ("removeNonManifolds", "Remove non-manifolds"),
-            ("removeFoldsOnSurface", "Remove surface folds"),
-        ]
-
-        for method_name, description in repair_methods:
-            try:
-                if hasattr(mutable_mesh, method_name):
-                    FreeCAD.Console.PrintMessage(f"🔧 {description}...\n")
-                    method = getattr(mutable_mesh, method_name)
-                    method()
-                    repairs_applied.append(description)
-                    # --- DIAGNOSTIC: Solid status after each general repair step ---
-                    FreeCAD.Console.PrintMessage(f"📊 DIAGNOSTIC: Solid after {method_name}: {mutable_mesh.isSolid()}, Points: {mutable_mesh.CountPoints}, Facets: {mutable_mesh.CountFacets}\n")
+        # 'fixSelfIntersections' and 'harmonizeNormals' were handled above
+        try:
+            log_lines.append("🔧 Remove duplicate points...")
+            mutable_mesh.removeDuplicatedPoints()
+            repairs_applied.append("Remove duplicate points")
+            # --- DIAGNOSTIC: Solid status after removeDuplicatedPoints ---
+            last_is_solid = mutable_mesh.isSolid()
+            log_lines.append(f"📊 DIAGNOSTIC: Solid after removeDuplicatedPoints: {last_is_solid}, Points: {mutable_mesh.CountPoints}, Facets: {mutable_mesh.CountFacets}")
+        except Exception as e:
+            log_lines.append(f"🔧 Remove duplicate points failed: {e}")
 
-            except Exception as e:
-                FreeCAD.Console.PrintMessage(f"🔧 {description} failed: {e}\n")
+        try:
+            log_lines.append("🔧 Remove duplicate facets...")
+            mutable_mesh.removeDuplicatedFacets()
+            repairs_applied.append("Remove duplicate facets")
+            # --- DIAGNOSTIC: Solid status after removeDuplicatedFacets ---
+            last_is_solid = mutable_mesh.isSolid()
+            log_lines.append(f"📊 DIAGNOSTIC: Solid after removeDuplicatedFacets: {last_is_solid}, Points: {mutable_mesh.CountPoints}, Facets: {mutable_mesh.CountFacets}")
+        except Exception as e:
+            log_lines.append(f"🔧 Remove duplicate facets failed: {e}")
 
-        # Try additional cleanup (on the mutable mesh)
         try:
-            FreeCAD.Console.PrintMessage("🔧 Fill small holes...\n")
-            mutable_mesh.fillupHoles(100)
-            repairs_applied.append("Fill small holes")
-            # --- DIAGNOSTIC: Solid status after fillupHoles ---
-            FreeCAD.Console.PrintMessage(f"📊 DIAGNOSTIC: Solid after fillupHoles: {mutable_mesh.isSolid()}, Points: {mutable_mesh.CountPoints}, Facets: {mutable_mesh.CountFacets}\n")
+            log_lines.append("🔧 Remove invalid points...")
+            mutable_mesh.removeInvalidPoints()
+            repairs_applied.append("Remove invalid points")
+            # --- DIAGNOSTIC: Solid status after removeInvalidPoints ---
+            last_is_solid = mutable_mesh.isSolid()
+            log_lines.append(f"📊 DIAGNOSTIC: Solid after removeInvalidPoints: {last_is_solid}, Points: {mutable_mesh.CountPoints}, Facets: {mutable_mesh.CountFacets}")
+        except Exception as e:
+            log_lines.append(f"🔧 Remove invalid points failed: {e}")
+
+        # Only remove non-manifolds if there were some, or the self-intersection fix introduced some
+        needs_non_manifold_repair = initial_has_non_manifolds is None or initial_has_non_manifolds
+        if not needs_non_manifold_repair and initial_has_self_intersections:
+            needs_non_manifold_repair = mutable_mesh.hasNonManifolds()
+
+        if needs_non_manifold_repair:
+            try:
+                log_lines.append("🔧 Remove non-manifolds...")
+                mutable_mesh.removeNonManifolds()
+                repairs_applied.append("Remove non-manifolds")
+                # --- DIAGNOSTIC: Solid status after removeNonManifolds ---
+                last_is_solid = mutable_mesh.isSolid()
+                log_lines.append(f"📊 DIAGNOSTIC: Solid after removeNonManifolds: {last_is_solid}, Points: {mutable_mesh.CountPoints}, Facets: {mutable_mesh.CountFacets}")
+            except Exception as e:
+                log_lines.append(f"🔧 Remove non-manifolds failed: {e}")
+        else:
+            log_lines.append("🔧 Remove non-manifolds skipped (none found)")
 
+        try:
+            log_lines.append("🔧 Remove surface folds...")
+            mutable_mesh.removeFoldsOnSurface()
+            repairs_applied.append("Remove surface folds")
+            # --- DIAGNOSTIC: Solid status after removeFoldsOnSurface ---
+            last_is_solid = mutable_mesh.isSolid()
+            log_lines.append(f"📊 DIAGNOSTIC: Solid after removeFoldsOnSurface: {last_is_solid}, Points: {mutable_mesh.CountPoints}, Facets: {mutable_mesh.CountFacets}")
         except Exception as e:
-            FreeCAD.Console.PrintMessage(f"🔧 Fill small holes failed: {e}\n")
+            log_lines.append(f"🔧 Remove surface folds failed: {e}")
+
+        # Try additional cleanup (on the mutable mesh), only needed if facets were removed
+        if mutable_mesh.CountFacets < initial_facet_count:
+            try:
+                log_lines.append("🔧 Fill small holes...")
+                mutable_mesh.fillupHoles(100)
+                repairs_applied.append("Fill small holes")
+                # --- DIAGNOSTIC: Solid status after fillupHoles ---
+                last_is_solid = mutable_mesh.isSolid()
+                log_lines.append(f"📊 DIAGNOSTIC: Solid after fillupHoles: {last_is_solid}, Points: {mutable_mesh.CountPoints}, Facets: {mutable_mesh.CountFacets}")
+
+            except Exception as e:
+                log_lines.append(f"🔧 Fill small holes failed: {e}")
+        else:
+            log_lines.append("🔧 Fill small holes skipped (no facets removed)")
 
         if repairs_applied:
             # Assign the modified mutable mesh back to the original document object
             mesh_obj.Mesh = mutable_mesh
-            
-            # Recompute multiple times to ensure FreeCAD's internal caches are fully updated
-            FreeCAD.ActiveDocument.recompute()
-            FreeCAD.ActiveDocument.recompute()
-            FreeCAD.ActiveDocument.recompute()
+            # No recompute needed here: the assignment updates the property directly
 
-            # Get the latest state from the document object AFTER recompute
+            # Get the latest state from the document object, reusing the last diagnostic solid check
             current_mesh_data = mesh_obj.Mesh
-            is_solid = current_mesh_data.isSolid()
+            is_solid = last_is_solid
             has_non_manifolds = current_mesh_data.hasNonManifolds()
             
             # Determine the final self-intersection status based on the internal check if performed
             # Otherwise, rely on the document object's updated report.
-            final_has_self_intersections = current_mesh_data.hasSelfIntersections() # Default to document's report
-            if initial_has_self_intersections: # Only override if the priority fix was attempted
-                final_has_self_intersections = not self_intersections_fixed_on_mutable
+            if initial_has_self_intersections: # The priority fix already re-checked the mutable mesh
+                final_has_self_intersections = last_has_self_intersections
+            else:
+                final_has_self_intersections = current_mesh_data.hasSelfIntersections()
 
 
-            FreeCAD.Console.PrintMessage(f"🔧 Manual repairs applied: {', '.join(repairs_applied)}\n")
-            FreeCAD.Console.PrintMessage(f"🔧 Result: Solid={is_solid}, Non-manifolds={has_non_manifolds}, Self-intersections={final_has_self_intersections}\n")
+            log_lines.append(f"🔧 Manual repairs applied: {', '.join(repairs_applied)}")
+            log_lines.append(f"🔧 Result: Solid={is_solid}, Non-manifolds={has_non_manifolds}, Self-intersections={final_has_self_intersections}")
 
             # Adjust return condition to use the accurate self-intersection status
             return is_solid and not has_non_manifolds and not final_has_self_intersections
         else:
-            FreeCAD.Console.PrintMessage("🔧 No manual repairs were successfully applied.\n")
+            log_lines.append("🔧 No manual repairs were successfully applied.")
             return False # No repairs means no success
 
     except Exception as e:
+        _flush_log(log_lines)
         FreeCAD.Console.PrintError(f"Manual repair error for '{mesh_obj.Name}': {e}\n")
         return False
 
+    finally:
+        _flush_log(log_lines)
+        # The repaired data was copied into mesh_obj.Mesh; release the scratch copy
+        _mesh_scratch.clear()
+
 
 # --- Updated main repair function that tries all methods ---
-def attempt_mesh_repair(mesh_obj, has_non_manifolds=None, has_self_intersections=None):
+def attempt_mesh_repair(mesh_obj, has_non_manifolds=None, has_self_intersections=None, topology=None):
     """
     Main repair function that only attempts the comprehensive manual repair approach.
+    'topology' is the mesh's current Topology tuple if the caller already extracted it.
     Returns True if repair was successful, False otherwise.
     """
     try:
         FreeCAD.Console.PrintMessage(f"🔧 === Starting repair for '{mesh_obj.Name}' ===\n")
 
         # Only call the comprehensive manual repair, as it's the one that can be fixed
-        success = attempt_comprehensive_manual_repair(mesh_obj)
+        success = attempt_comprehensive_manual_repair(
+            mesh_obj,
+            topology=topology,
+            initial_has_non_manifolds=has_non_manifolds,
+            initial_has_self_intersections=has_self_intersections,
+        )
 
         if success:
             FreeCAD.Console.PrintMessage("🔧 REPAIR: Automatic repair successful - proceeding with conversion\n")
@@ -151,58 +287,237 @@ def attempt_mesh_repair(mesh_obj, has_non_manifolds=None, has_self_intersections
         return False
 
 
-# --- Automated mesh evaluation function ---
-def evaluate_mesh_automated(selected_mesh):
+# --- Evaluation cache ---
+# Maps mesh object name -> (mesh key, evaluation flags). The key changes whenever the
+# mesh data changes (e.g. after repair), so stale entries are never reused. A key without
+# a fingerprint (see _evaluation_key) never matches, it only records the point/facet counts.
+_evaluation_cache = {}
+
+def _mesh_fingerprint(topology):
     """
-    Automated mesh evaluation that replaces the GUI popup.
-    Returns: 'proceed', 'repair', or 'cancel' based on mesh quality.
+    Return a short digest of a (points, facets) Topology tuple.
+    Covers point coordinates as well as facet indices, and is stable across sessions.
+    Packing the points walks every FreeCAD.Vector through the sequence protocol, so this
+    costs a Python-level pass over the mesh; it is still far cheaper than the checks it saves.
     """
-    try:
-        mesh = selected_mesh.Mesh
-
-        # Core evaluation
-        is_solid = mesh.isSolid()
-        has_non_manifolds = mesh.hasNonManifolds()
-        has_self_intersections = mesh.hasSelfIntersections()
-
-        # Log the evaluation results
-        FreeCAD.Console.PrintMessage(f"\n=== MESH EVALUATION: {selected_mesh.Name} ===\n")
-        FreeCAD.Console.PrintMessage(f"Points: {mesh.CountPoints}, Facets: {mesh.CountFacets}\n")
-        FreeCAD.Console.PrintMessage(f"Is Solid: {'YES' if is_solid else 'NO'}\n")
-        FreeCAD.Console.PrintMessage(f"Has Non-Manifolds: {'YES' if has_non_manifolds else 'NO'}\n")
-        FreeCAD.Console.PrintMessage(f"Has Self-Intersections: {'YES' if has_self_intersections else 'NO'}\n")
-
-        if is_solid:
-            FreeCAD.Console.PrintMessage(f"Volume: {mesh.Volume:.3f}\n")
-            FreeCAD.Console.PrintMessage(f"Surface Area: {mesh.Area:.3f}\n")
-
-        # Decision logic
-        if is_solid and not has_non_manifolds and not has_self_intersections:
-            FreeCAD.Console.PrintMessage("✅ DECISION: Mesh is clean - proceeding with conversion\n")
-            return "proceed"
-
-        elif is_solid and (has_non_manifolds or has_self_intersections):
-            FreeCAD.Console.PrintMessage("⚠️  DECISION: Mesh is solid but has issues - attempting automatic repair\n")
-
-            # Attempt automatic repair using improved repair system
-            # Pass existing evaluation results to avoid re-calculating (though not strictly necessary now)
-            repair_success = attempt_mesh_repair(selected_mesh, has_non_manifolds, has_self_intersections)
-
-            if repair_success:
-                FreeCAD.Console.PrintMessage("🔧 REPAIR: Automatic repair successful - proceeding with conversion\n")
-                return "proceed"
-            else:
-                # If repair failed, it should return 'repair' to indicate it needs further attention
-                FreeCAD.Console.PrintMessage("🔧 REPAIR: Automatic repair failed - skipping this mesh\n")
-                return "repair"
+    points = np.asarray(topology[0], dtype=np.float64)
+    facets = np.asarray(topology[1], dtype=np.int32)
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(points.tobytes())
+    digest.update(facets.tobytes())
+    return digest.hexdigest()
+
+
+def _evaluation_key(mesh_obj, topology, fingerprint=False):
+    """
+    Return the cache key identifying the current mesh data of a mesh object.
+    'topology' must be the mesh's current Topology tuple.
+    The mesh is only fingerprinted when the result can be used: a cached entry has the same
+    point/facet counts, a persistent cache is active, or the caller asks for it (fingerprint=True).
+    Otherwise the fingerprint is None and the key cannot produce a cache hit.
+    """
+    mesh = mesh_obj.Mesh
+    counts = (mesh.CountPoints, mesh.CountFacets)
+    cached = _evaluation_cache.get(mesh_obj.Name)
+    if fingerprint or _persistent_cache_state['path'] is not None or (cached is not None and cached[0][:2] == counts):
+        return counts + (_mesh_fingerprint(topology),)
+    return counts + (None,)
+
+
+def _cached_evaluation(mesh_obj, key):
+    """
+    Return the memoized evaluation flags of a mesh object, or None if its mesh data changed since.
+    """
+    cached = _evaluation_cache.get(mesh_obj.Name)
+    if cached is None or key[2] is None:
+        return None
+    return cached[1] if cached[0] == key else None
+
+
+def _evaluate_only(mesh_obj, topology=None, key=None):
+    """
+    Evaluate mesh quality without modifying the mesh.
+    Returns a dict with 'is_solid', 'has_non_manifolds' and 'has_self_intersections'.
+    Results are memoized per mesh object until its mesh data changes.
+    A key already computed by the caller is reused instead of fingerprinting the mesh again.
+    """
+    if key is None:
+        if topology is None:
+            topology = mesh_obj.Mesh.Topology
+        key = _evaluation_key(mesh_obj, topology)
+    flags = _cached_evaluation(mesh_obj, key)
+    if flags is not None:
+        return flags
+
+    mesh = mesh_obj.Mesh
+    flags = {
+        'is_solid': mesh.isSolid(),
+        'has_non_manifolds': mesh.hasNonManifolds(),
+        'has_self_intersections': mesh.hasSelfIntersections(),
+    }
+    _evaluation_cache[mesh_obj.Name] = (key, flags)
+    return flags
+
+
+def _log_evaluation(mesh_obj, flags, verbose=False):
+    """
+    Print the evaluation results of a mesh object.
+    Volume and area each need a full pass over the facets, so they are only printed when verbose.
+    """
+    mesh = mesh_obj.Mesh
+    FreeCAD.Console.PrintMessage(f"\n=== MESH EVALUATION: {mesh_obj.Name} ===\n")
+    FreeCAD.Console.PrintMessage(f"Points: {mesh.CountPoints}, Facets: {mesh.CountFacets}\n")
+    FreeCAD.Console.PrintMessage(f"Is Solid: {'YES' if flags['is_solid'] else 'NO'}\n")
+    FreeCAD.Console.PrintMessage(f"Has Non-Manifolds: {'YES' if flags['has_non_manifolds'] else 'NO'}\n")
+    FreeCAD.Console.PrintMessage(f"Has Self-Intersections: {'YES' if flags['has_self_intersections'] else 'NO'}\n")
+
+    if verbose and flags['is_solid']:
+        FreeCAD.Console.PrintMessage(f"Volume: {mesh.Volume:.3f}\n")
+        FreeCAD.Console.PrintMessage(f"Surface Area: {mesh.Area:.3f}\n")
+
+
+def _is_clean(flags):
+    """
+    Return True if the evaluation flags describe a mesh that can be converted as is.
+    """
+    return flags['is_solid'] and not flags['has_non_manifolds'] and not flags['has_self_intersections']
+
+
+def _maybe_repair(mesh_obj, flags, topology=None):
+    """
+    Decide what to do with a mesh from its evaluation flags, repairing it if possible.
+    Returns (decision, repaired): decision is 'proceed' or 'repair', repaired is True if the
+    mesh data was replaced by a successful repair.
+    """
+    is_solid = flags['is_solid']
+    has_non_manifolds = flags['has_non_manifolds']
+    has_self_intersections = flags['has_self_intersections']
+
+    if _is_clean(flags):
+        FreeCAD.Console.PrintMessage("✅ DECISION: Mesh is clean - proceeding with conversion\n")
+        return "proceed", False
 
+    elif is_solid and (has_non_manifolds or has_self_intersections):
+        FreeCAD.Console.PrintMessage("⚠️  DECISION: Mesh is solid but has issues - attempting automatic repair\n")
+
+        # Attempt automatic repair using improved repair system
+        # Pass existing evaluation results to avoid re-calculating (though not strictly necessary now)
+        repair_success = attempt_mesh_repair(mesh_obj, has_non_manifolds, has_self_intersections, topology)
+
+        if repair_success:
+            FreeCAD.Console.PrintMessage("🔧 REPAIR: Automatic repair successful - proceeding with conversion\n")
+            return "proceed", True
         else:
-            FreeCAD.Console.PrintMessage("❌ DECISION: Mesh is not solid - skipping this mesh\n")
-            return "repair"
+            # If repair failed, it should return 'repair' to indicate it needs further attention
+            FreeCAD.Console.PrintMessage("🔧 REPAIR: Automatic repair failed - skipping this mesh\n")
+            return "repair", False
+
+    else:
+        FreeCAD.Console.PrintMessage("❌ DECISION: Mesh is not solid - skipping this mesh\n")
+        return "repair", False
+
+
+# --- Persistent evaluation cache ---
+# Evaluation results are stored next to the saved document (<FileName>.mtbb_cache) so the
+# expensive checks are not re-run on unchanged meshes in the next session.
+# On disk (JSON): {name: [[CountPoints, CountFacets, fingerprint], is_solid, has_non_manifolds, has_self_intersections]}
+_persistent_cache_state = {'path': None, 'doc_name': None}
+
+def _persistent_cache_path(doc):
+    """
+    Return the cache file path for a document, or None if the document was never saved.
+    """
+    if doc is None or not doc.FileName:
+        return None
+    return f"{doc.FileName}.mtbb_cache"
+
+
+def _load_persistent_cache(doc):
+    """
+    Merge the on-disk evaluation cache of a document into the in-memory evaluation cache.
+    Missing or unreadable cache files are ignored.
+    """
+    path = _persistent_cache_path(doc)
+    if path is None or path == _persistent_cache_state['path']:
+        return
+
+    _persistent_cache_state['path'] = path
+    _persistent_cache_state['doc_name'] = doc.Name
+
+    loaded = {}
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            entries = json.load(f)
+
+        for name, entry in entries.items():
+            try:
+                (count_points, count_facets, fingerprint), is_solid, has_non_manifolds, has_self_intersections = entry
+            except (TypeError, ValueError):
+                continue
+            if not (isinstance(count_points, int) and isinstance(count_facets, int) and isinstance(fingerprint, str)
+                    and all(isinstance(flag, bool) for flag in (is_solid, has_non_manifolds, has_self_intersections))):
+                continue
+            loaded[name] = ((count_points, count_facets, fingerprint), {
+                'is_solid': is_solid,
+                'has_non_manifolds': has_non_manifolds,
+                'has_self_intersections': has_self_intersections,
+            })
+    except Exception:
+        return
+
+    for name, cached in loaded.items():
+        # Entries computed in this session are newer than the ones on disk
+        _evaluation_cache.setdefault(name, cached)
+
+
+def _save_persistent_cache():
+    """
+    Write the evaluation results of the loaded document's meshes to its cache file.
+    """
+    path = _persistent_cache_state['path']
+    if path is None:
+        return
+
+    doc = FreeCAD.listDocuments().get(_persistent_cache_state['doc_name'])
+    if doc is None:
+        return
+
+    entries = {
+        name: [list(key), flags['is_solid'], flags['has_non_manifolds'], flags['has_self_intersections']]
+        for name, (key, flags) in _evaluation_cache.items()
+        if key[2] is not None and doc.getObject(name)
+    }
+
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(entries, f)
+    except Exception as e:
+        FreeCAD.Console.PrintWarning(f"Could not write evaluation cache '{path}': {e}\n")
+
+
+# --- Automated mesh evaluation function ---
+def _evaluate_and_repair(selected_mesh, verbose=False, topology=None, key=None):
+    """
+    Evaluate a mesh (reusing cached results) and repair it if needed.
+    'topology' and 'key' are the mesh's current Topology tuple and evaluation key if the caller already computed them.
+    Returns (decision, repaired) as _maybe_repair, with decision 'cancel' on evaluation errors.
+    """
+    try:
+        flags = _evaluate_only(selected_mesh, topology, key)
+        _log_evaluation(selected_mesh, flags, verbose)
+        return _maybe_repair(selected_mesh, flags, topology)
 
     except Exception as e:
         FreeCAD.Console.PrintError(f"Mesh evaluation error for '{selected_mesh.Name}': {e}\n")
-        return "cancel"
+        return "cancel", False
+
+
+def evaluate_mesh_automated(selected_mesh, verbose=False, topology=None, key=None):
+    """
+    Automated mesh evaluation that replaces the GUI popup.
+    Returns: 'proceed', 'repair', or 'cancel' based on mesh quality.
+    """
+    return _evaluate_and_repair(selected_mesh, verbose, topology, key)[0]
 
 
 # --- Function to find all mesh objects in document ---
@@ -218,16 +533,12 @@ def find_all_mesh_objects(doc=None):
         FreeCAD.Console.PrintError("No active document found.\n")
         return [], {}
 
-    all_objects = doc.Objects
-    mesh_objects = []
-
-    for obj in all_objects:
-        if hasattr(obj, 'Mesh') and isinstance(obj.Mesh, Mesh.Mesh):
-            mesh_objects.append(obj)
+    # Type-filtered query through FreeCAD's type system (includes derived mesh features)
+    mesh_objects = doc.findObjects(Type='Mesh::Feature')
 
     # Generate summary
     summary = {
-        'total_objects': len(all_objects),
+        'total_objects': len(doc.Objects),
         'mesh_objects': len(mesh_objects),
         'mesh_names': [obj.Name for obj in mesh_objects]
     }
@@ -236,65 +547,67 @@ def find_all_mesh_objects(doc=None):
 
 
 # --- Single mesh conversion function ---
-def convert_single_mesh(mesh_obj, base_transaction=False):
+def convert_single_mesh(mesh_obj, base_transaction=False, verbose=False):
     """
     Convert a single mesh to PartDesign Body.
     Returns (success: bool, body_name: str or None)
     """
     doc = FreeCAD.ActiveDocument
+    base_name = mesh_obj.Name
+    simple_copy_obj = None
+    body_obj = None
 
     if not base_transaction:
         doc.openTransaction(f"Convert Mesh: {mesh_obj.Name}")
 
     try:
-        # Evaluate mesh
-        evaluation_result = evaluate_mesh_automated(mesh_obj)
+        # Extract the Topology once for this conversion; it is shared by evaluation, repair and shape building
+        topology = mesh_obj.Mesh.Topology
+        key = _evaluation_key(mesh_obj, topology)
+
+        # Evaluate mesh; meshes already known to be clean come straight from the evaluation cache
+        evaluation_result, repaired = _evaluate_and_repair(mesh_obj, verbose, topology, key)
 
         if evaluation_result != "proceed":
             if not base_transaction:
                 doc.abortTransaction()
             return False, None
 
-        FreeCAD.Console.PrintMessage(f"🔄 Starting conversion of '{mesh_obj.Name}'...\n")
-
-        base_name = mesh_obj.Name
+        # A repaired mesh was replaced in place, so its old Topology no longer applies
+        if repaired:
+            topology = mesh_obj.Mesh.Topology
 
-        # Convert Mesh to Shape
-        shape_obj = doc.addObject('Part::Feature', base_name + "_shape")
-        shape = Part.Shape()
-        # Pass the entire Topology tuple here as well
-        shape.makeShapeFromMesh(mesh_obj.Mesh.Topology, 0.1, False)
-        shape_obj.Shape = shape
-        shape_obj.purgeTouched()
+        FreeCAD.Console.PrintMessage(f"🔄 Starting conversion of '{mesh_obj.Name}'...\n")
 
-        # Convert to Solid
-        solid_obj = doc.addObject("Part::Feature", base_name + "_solid")
-        solid_obj.Shape = Part.Solid(Part.Shell(shape_obj.Shape.Faces))
+        # Build the final shape in memory; only the simple copy and the Body become document objects
+        # Convert Mesh to Shape, passing the entire Topology tuple
+        shape = _shape_scratch
+        shape.makeShapeFromMesh(topology, 0.1, False)
 
-        # Refine Shape
-        refined_obj = doc.addObject("Part::Refine", base_name + "_solid_refined")
-        refined_obj.Source = solid_obj
-        solid_obj.Visibility = False
+        # Convert to Solid: sew the mesh-derived faces in place and build the solid
+        # from the resulting shell, instead of rebuilding a Shell from the face list
+        shape.sewShape()
+        solid = Part.makeSolid(shape)
 
-        doc.recompute()
+        # Refine Shape (same operation as a Part::Refine feature)
+        refined = solid.removeSplitter()
 
-        if refined_obj.Shape and refined_obj.Shape.isValid():
+        if not refined.isNull() and refined.isValid():
             simple_copy_obj = doc.addObject("Part::Feature", base_name + "_solid_simple")
-            simple_copy_obj.Shape = refined_obj.Shape
+            simple_copy_obj.Shape = refined
 
             body_obj = doc.addObject("PartDesign::Body", base_name + "_Body")
             body_obj.BaseFeature = simple_copy_obj
             simple_copy_obj.Visibility = False
 
-            # Cleanup intermediate objects
-            doc.removeObject(shape_obj.Name)
-            doc.removeObject(solid_obj.Name)
-            doc.removeObject(refined_obj.Name)
-
             # Remove original mesh
+            _evaluation_cache.pop(mesh_obj.Name, None)
             doc.removeObject(mesh_obj.Name)
 
-            doc.recompute()
+            # In batch mode the caller recomputes the document once at the end;
+            # otherwise only the two new objects need recomputing
+            if not base_transaction:
+                doc.recompute([simple_copy_obj, body_obj])
 
             FreeCAD.Console.PrintMessage(f"✅ Successfully created: {body_obj.Name}\n")
 
@@ -308,18 +621,12 @@ def convert_single_mesh(mesh_obj, base_transaction=False):
 
     except Exception as e:
         # Cleanup on error
-        temp_objects = [name for name in [
-            base_name + "_shape",
-            base_name + "_solid",
-            base_name + "_solid_refined",
-            base_name + "_solid_simple"
-        ] if doc.getObject(name)]
-
-        for obj_name in temp_objects:
-            try:
-                doc.removeObject(obj_name)
-            except:
-                pass
+        for obj in (body_obj, simple_copy_obj):
+            if obj is not None:
+                try:
+                    doc.removeObject(obj.Name)
+                except Exception:
+                    pass
 
         if not base_transaction:
             doc.abortTransaction()
@@ -327,13 +634,31 @@ def convert_single_mesh(mesh_obj, base_transaction=False):
         FreeCAD.Console.PrintError(f"❌ Conversion failed for '{mesh_obj.Name}': {e}\n")
         return False, None
 
+    finally:
+        # The refined shape holds its own references; release the scratch B-rep
+        _shape_scratch.nullify()
+
 
 # --- Document-wide conversion function ---
-def convert_all_document_meshes(show_summary=True):
+def convert_all_document_meshes(show_summary=True, verbose=False):
     """
     Convert all mesh objects in the current document to PartDesign Bodies.
+    verbose=False (default): console output is buffered and GUI updates are suspended until
+    the batch ends, and the evaluation log omits mesh volume/area (each a full facet pass).
+    verbose=True: output is printed as it happens and volume/area are included.
     Returns conversion statistics.
     """
+    if verbose:
+        return _convert_all_document_meshes(show_summary, verbose)
+
+    with _batch_mode():
+        return _convert_all_document_meshes(show_summary, verbose)
+
+
+def _convert_all_document_meshes(show_summary, verbose):
+    """
+    Implementation of convert_all_document_meshes.
+    """
     start_time = time.time()
     doc = FreeCAD.ActiveDocument
 
@@ -343,6 +668,7 @@ def convert_all_document_meshes(show_summary=True):
 
     # Find all mesh objects
     mesh_objects, summary = find_all_mesh_objects(doc)
+    _load_persistent_cache(doc)
 
     if not mesh_objects:
         FreeCAD.Console.PrintMessage("No mesh objects found in document.\n")
@@ -383,20 +709,24 @@ def convert_all_document_meshes(show_summary=True):
             # Store original name for tracking
             original_name = mesh_obj.Name
 
-            success, body_name = convert_single_mesh(mesh_obj, base_transaction=True)
+            success, body_name = convert_single_mesh(mesh_obj, base_transaction=True, verbose=verbose)
 
             if success:
                 results['converted'] += 1
                 results['converted_objects'].append({'original': original_name, 'body': body_name})
             else:
                 # Check if it was skipped due to quality issues vs actual failure
-                if doc.getObject(original_name) and doc.getObject(original_name).TypeId == 'Mesh::Feature':  # Original mesh still exists
+                remaining_obj = doc.getObject(original_name)
+                if remaining_obj and remaining_obj.TypeId == 'Mesh::Feature':  # Original mesh still exists
                     results['skipped'] += 1
                     results['skipped_objects'].append(original_name)
                 else:
                     results['failed'] += 1
                     results['failed_objects'].append(original_name)
 
+        # Keep the results of meshes left in the document for the next run
+        _save_persistent_cache()
+
         # Commit the master transaction
         doc.commitTransaction()
 
@@ -457,6 +787,8 @@ def analyze_document_meshes():
         FreeCAD.Console.PrintMessage("No mesh objects found in document.\n")
         return
 
+    _load_persistent_cache(FreeCAD.ActiveDocument)
+
     FreeCAD.Console.PrintMessage(f"\n{'='*60}\n")
     FreeCAD.Console.PrintMessage(f"DOCUMENT MESH ANALYSIS\n")
     FreeCAD.Console.PrintMessage(f"{'='*60}\n")
@@ -468,21 +800,30 @@ def analyze_document_meshes():
     }
 
     for mesh_obj in mesh_objects:
-        # Pass the mesh_obj to evaluate_mesh_automated so it can perform repairs
-        evaluation = evaluate_mesh_automated(mesh_obj)
-        if evaluation == "proceed":
+        # Evaluate only; meshes are not modified here. The results are cached for a later conversion.
+        try:
+            # Always fingerprint here so a later conversion can reuse the results
+            topology = mesh_obj.Mesh.Topology
+            flags = _evaluate_only(mesh_obj, topology, _evaluation_key(mesh_obj, topology, fingerprint=True))
+        except Exception as e:
+            FreeCAD.Console.PrintError(f"Mesh evaluation error for '{mesh_obj.Name}': {e}\n")
+            analysis_results['problematic'] += 1
+            continue
+
+        _log_evaluation(mesh_obj, flags, verbose=True)
+        if _is_clean(flags):
             analysis_results['clean'] += 1
-        elif evaluation == "repair":
+        else:
             analysis_results['repairable'] += 1
-        else: # 'cancel' or other error
-            analysis_results['problematic'] += 1
 
     FreeCAD.Console.PrintMessage(f"\nSUMMARY:\n")
     FreeCAD.Console.PrintMessage(f"✅ Clean meshes (ready to convert): {analysis_results['clean']}\n")
-    FreeCAD.Console.PrintMessage(f"🔧 Meshes needing repair (or failed repair): {analysis_results['repairable']}\n")
+    FreeCAD.Console.PrintMessage(f"🔧 Meshes needing repair: {analysis_results['repairable']}\n")
     FreeCAD.Console.PrintMessage(f"❌ Problematic meshes (evaluation error): {analysis_results['problematic']}\n")
     FreeCAD.Console.PrintMessage(f"{'='*60}\n")
 
+    _save_persistent_cache()
+
 
 # --- Main execution ---
 if __name__ == "__main__":